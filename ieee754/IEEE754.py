@@ -1,4 +1,99 @@
-from decimal import Decimal, getcontext
+import struct
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    Context,
+    Decimal,
+    InvalidOperation,
+    localcontext,
+)
+from functools import cached_property, lru_cache
+from typing import Optional
+
+# exponent bits, mantissa bits and bias of half, single, double, quadruple
+# and octuple precision, indexed by the precision argument
+_EXPONENT: tuple = (5, 8, 11, 15, 19)
+_MANTISSA: tuple = (10, 23, 52, 112, 236)
+_BIAS: tuple = (15, 127, 1023, 16383, 262143)
+# struct formats of the precisions the hardware encodes natively
+_STRUCT_FORMAT: dict = {0: ">e", 1: ">f", 2: ">d"}
+# initial json output, copied by every instance
+_OUTPUT: dict = {
+    "number": "",
+    "edge_case": False,
+    "sign_bit": "",
+    "exponent_bits": "",
+    "mantissa_bits": "",
+    "total_bits": "",
+    "sign": "",
+    "scale": "",
+    "scaled_number": "",
+    "scaled_number_in_binary": "",
+    "unable_to_scale": False,
+    "bias": "",
+    "bias_in_binary": "",
+    "exponent": "",
+    "mantissa": "",
+    "mantissa_base_10": "",
+    "result": "",
+    "hexadecimal": "",
+    "hexadecimal_parts": [],
+    "converted_number": "",
+    "error": "",
+}
+# a context that never rounds, for exact scaling by powers of ten
+_EXACT: Context = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+@lru_cache(maxsize=None)
+def _edge_cases(exponent_bits: int, mantissa_bits: int) -> dict:
+    """
+    Sign, exponent, mantissa and the whole representation of the edge cases
+    for a given number of exponent and mantissa bits.
+    """
+    ones, zeros = "1" * exponent_bits, "0" * exponent_bits
+    fields = {
+        # +inf: 0 11111111 00000000000000000000000
+        "+inf": ("0", ones, "0" * mantissa_bits),
+        # -inf: 1 11111111 00000000000000000000000
+        "-inf": ("1", ones, "0" * mantissa_bits),
+        # snan: 0 11111111 00000000000000000000001
+        "snan": ("0", ones, f"{'0' * (mantissa_bits - 1)}1"),
+        # qnan: 0 11111111 10000000000000000000000
+        "qnan": ("0", ones, f"1{'0' * (mantissa_bits - 1)}"),
+        # +0: 0 00000000 00000000000000000000000
+        "+0": ("0", zeros, "0" * mantissa_bits),
+        # -0: 1 00000000 00000000000000000000000
+        "-0": ("1", zeros, "0" * mantissa_bits),
+    }
+    return {name: (*bits, " ".join(bits)) for name, bits in fields.items()}
+
+
+@lru_cache(maxsize=None)
+def _context(bias: int, mantissa_bits: int) -> Context:
+    """
+    Decimal context of a format, with enough digits for the exact expansion
+    of its smallest denormalized number, and at least 256 digits for the
+    error of long decimal inputs.
+    """
+    return Context(prec=max(256, 20 + (bias + mantissa_bits) * 7 // 10))
+
+
+def _exact_binary(significand: int, exponent: int) -> Decimal:
+    """
+    Exact Decimal value of significand * 2**exponent, with the trailing zeros
+    of the significand dropped to keep the result minimal.
+    """
+    if significand == 0:
+        return Decimal(0)
+    trailing_zeros = (significand & -significand).bit_length() - 1
+    significand >>= trailing_zeros
+    exponent += trailing_zeros
+    if exponent >= 0:
+        return Decimal(significand << exponent)
+    # 2**-k is 5**k * 10**-k
+    return Decimal(significand * 5**-exponent).scaleb(exponent, _EXACT)
 
 
 class IEEE754:
@@ -34,44 +129,30 @@ class IEEE754:
         force_exponent: int = None,
         force_mantissa: int = None,
     ) -> None:
-        getcontext().prec = 256
         self.precision: int = precision
-        exponent_list: list[int] = [5, 8, 11, 15, 19]
-        mantissa_list: list[int] = [10, 23, 52, 112, 236]
+        if (force_exponent is None or force_mantissa is None) and not (
+            0 <= self.precision < len(_EXPONENT)
+        ):
+            raise ValueError(
+                f"Invalid precision: {self.precision}, must be between 0 and {len(_EXPONENT) - 1}."
+            )
         self.__exponent: int = (
             force_exponent
             if force_exponent is not None
-            else exponent_list[self.precision]
+            else _EXPONENT[self.precision]
         )
         self.__mantissa: int = (
             force_mantissa
             if force_mantissa is not None
-            else mantissa_list[self.precision]
+            else _MANTISSA[self.precision]
+        )
+        self.output: dict = {**_OUTPUT, "hexadecimal_parts": []}
+        self.__bias: int = (
+            (1 << (self.__exponent - 1)) - 1
+            if force_exponent is not None
+            else _BIAS[self.precision]
         )
-        self.output: dict = {
-            "number": "",
-            "edge_case": False,
-            "sign_bit": "",
-            "exponent_bits": "",
-            "mantissa_bits": "",
-            "total_bits": "",
-            "sign": "",
-            "scale": "",
-            "scaled_number": "",
-            "scaled_number_in_binary": "",
-            "unable_to_scale": False,
-            "bias": "",
-            "bias_in_binary": "",
-            "exponent": "",
-            "mantissa": "",
-            "mantissa_base_10": "",
-            "result": "",
-            "hexadecimal": "",
-            "hexadecimal_parts": [],
-            "converted_number": "",
-            "error": "",
-        }
-        self.__bias: int = 2 ** (self.__exponent - 1) - 1
+        self.__context: Context = _context(self.__bias, self.__mantissa)
         self.__edge_case: str = None
         self.number: Decimal = self.validate_number(number)
         self.original_number: Decimal = self.number
@@ -83,90 +164,60 @@ class IEEE754:
             self.binary_output: str = (
                 f"{self.binary[:-self.__scale]}.{self.binary[-self.__scale:]}"
             )
-            self.exponent = self.find_exponent()
-            self.mantissa = self.find_mantissa()
-            self.converted_number, self.error = self.back_to_decimal_from_bits()
+            significand = self.round_significand()
+            self.exponent = self.find_exponent(significand)
+            self.mantissa = self.find_mantissa(significand)
 
     def validate_number(self, number: str) -> Decimal:
         if number == "":
             number = "0.0"
-        if Decimal(number).is_infinite():
-            if Decimal(number) > 0:
-                # +inf: 0 11111111 00000000000000000000000
-                self.sign = "0"
-                self.exponent = f"{'1' * self.__exponent}"
-                self.mantissa = f"{'0' * self.__mantissa}"
-                self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-                return Decimal("Infinity")
-            # -inf: 1 11111111 00000000000000000000000
-            self.sign = "1"
-            self.exponent = f"{'1' * self.__exponent}"
-            self.mantissa = f"{'0' * self.__mantissa}"
-            self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            return Decimal("-Infinity")
-        if Decimal(number).is_nan() and Decimal(number).is_snan():
-            # snan: 0 11111111 00000000000000000000001
-            self.sign = "0"
-            self.exponent = f"{'1' * self.__exponent}"
-            self.mantissa = f"{'0' * (self.__mantissa - 1)}1"
-            self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            return Decimal("NaN")
-        if Decimal(number).is_nan() and Decimal(number).is_qnan():
-            # qnan: 0 11111111 10000000000000000000000
-            self.sign = "0"
-            self.exponent = f"{'1' * self.__exponent}"
-            self.mantissa = f"1{'0' * (self.__mantissa - 1)}"
-            self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            return Decimal("NaN")
-        if not number == number:
-            # nan: 0 11111111 11111111111111111111111
-            self.sign = "0"
-            self.exponent = f"{'1' * self.__exponent}"
-            self.mantissa = f"{'1' * self.__mantissa}"
-            self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            return Decimal("NaN")
-        if Decimal(number) == 0:
-            if Decimal(number).is_signed():
-                # -0: 1 00000000 00000000000000000000000
-                self.sign = "1"
-                self.exponent = f"{'0' * self.__exponent}"
-                self.mantissa = f"{'0' * self.__mantissa}"
-                self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            else:
-                # +0: 0 00000000 00000000000000000000000
-                self.sign = "0"
-                self.exponent = f"{'0' * self.__exponent}"
-                self.mantissa = f"{'0' * self.__mantissa}"
-                self.__edge_case = f"{self.sign} {self.exponent} {self.mantissa}"
-            return Decimal("0")
         if isinstance(number, int):
             number = f"{number}.0"
         if not isinstance(number, str):
             number = str(number)
         try:
-            number = Decimal(number)
-        except:
+            d = Decimal(number)
+        except InvalidOperation:
             raise ValueError(f"Invalid number: {number}")
+        if d.is_infinite():
+            edge_case = "+inf" if d > 0 else "-inf"
+        elif d.is_snan():
+            edge_case = "snan"
+        elif d.is_qnan():
+            edge_case = "qnan"
+        elif d == 0:
+            edge_case = "-0" if d.is_signed() else "+0"
+        else:
+            edge_case = None
+        if edge_case is not None:
+            self.sign, self.exponent, self.mantissa, self.__edge_case = _edge_cases(
+                self.__exponent, self.__mantissa
+            )[edge_case]
+            if d.is_infinite():
+                return d
+            return Decimal("NaN") if d.is_nan() else Decimal("0")
+        magnitude = d.copy_abs()
         denormalized_range = self.calculate_denormalized_range(
             self.__exponent, self.__mantissa
         )
-        if Decimal(number).copy_abs() < Decimal(denormalized_range[0]):
+        if magnitude < denormalized_range[0]:
             raise ValueError(
-                f"Number is too small, must be larger than {denormalized_range[0]}, we lost both exponent and mantissa, please increase precision."
+                f"Number is too small, must be larger than {denormalized_range[0]:.6E}, we lost both exponent and mantissa, please increase precision."
             )
-        if Decimal(number).copy_abs() < Decimal(denormalized_range[1]):
+        elif magnitude < denormalized_range[1]:
             raise ValueError(
-                f"Number is too small, must be larger than {denormalized_range[1]}, we lost exponent, please increase precision."
+                f"Number is too small, must be larger than {denormalized_range[1]:.6E}, we lost exponent, please increase precision."
             )
-        return number
+        return d
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def calculate_denormalized_range(exponent_bits: int, mantissa_bits: int) -> tuple:
-        bias = 2 ** (exponent_bits - 1) - 1
-        smallest_normalized = 2 ** -(bias - 1)
-        smallest_denormalized = smallest_normalized * 2**-mantissa_bits
-        largest_denormalized = smallest_normalized - 2 ** -(bias + mantissa_bits - 1)
-
+        bias = (1 << (exponent_bits - 1)) - 1
+        smallest_denormalized = _exact_binary(1, -(bias - 1 + mantissa_bits))
+        largest_denormalized = _exact_binary(
+            (1 << mantissa_bits) - 1, -(bias - 1 + mantissa_bits)
+        )
         return (smallest_denormalized, largest_denormalized)
 
     def find_sign(self) -> str:
@@ -175,22 +226,53 @@ class IEEE754:
         return "0"
 
     def scale_up_to_integer(self, number: Decimal, base: int) -> (int, int):
-        scale = 0
-        while number != int(number):
-            number *= base
-            scale += 1
-        self.output["unable_to_scale"] = scale > 100
-        return scale, int(number)
-
-    def find_exponent(self) -> str:
-        exponent = len(self.binary) - 1 + self.__bias - self.__scale
+        numerator, denominator = number.as_integer_ratio()
+        exact = denominator & (denominator - 1) == 0
+        if exact:
+            # a power of two denominator: number * 2**scale is the numerator
+            scale = denominator.bit_length() - 1
+        else:
+            # a factor of 5 is left in the denominator, so no scale makes the
+            # number an integer; keep at least the hidden bit, the mantissa,
+            # a guard bit and a sticky bit
+            scale = max(
+                0,
+                self.__mantissa
+                + 3
+                - numerator.bit_length()
+                + denominator.bit_length(),
+            )
+        scaled, remainder = divmod(numerator * base**scale, denominator)
+        self.output["unable_to_scale"] = not exact
+        return scale, scaled | (remainder != 0)
+
+    def round_significand(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Scaled number rounded to the hidden bit plus the mantissa bits,
+            to nearest with ties to even, as the IEEE 754 default
+        """
+        shift = self.number.bit_length() - 1 - self.__mantissa
+        if shift <= 0:
+            return self.number << -shift
+        significand = self.number >> shift
+        remainder = self.number & ((1 << shift) - 1)
+        half = 1 << (shift - 1)
+        if remainder > half or (remainder == half and significand & 1):
+            significand += 1
+        return significand
+
+    def find_exponent(self, significand: int) -> str:
+        exponent = self.number.bit_length() - 1 + self.__bias - self.__scale
+        # rounding up a mantissa of all ones carries into the exponent
+        exponent += significand >> (self.__mantissa + 1)
         return f"{exponent:0{self.__exponent}b}"
 
-    def find_mantissa(self) -> str:
-        mantissa = f"{self.binary[1:]:<0{self.__mantissa}}"
-        if len(mantissa) > self.__mantissa:
-            mantissa = f"{mantissa[: self.__mantissa - 1]}1"
-        return mantissa
+    def find_mantissa(self, significand: int) -> str:
+        mantissa = significand & ((1 << self.__mantissa) - 1)
+        return f"{mantissa:0{self.__mantissa}b}"
 
     def __str__(self) -> str:
         if self.__edge_case is not None:
@@ -198,22 +280,70 @@ class IEEE754:
         return f"{self.sign} {self.exponent} {self.mantissa}"
 
     def hex(self) -> tuple:
-        h = ""
-        hex_parts = []
-        s = str(self).replace(" ", "")
-        if len(s) % 4 != 0:
-            next_multiple = (len(s) // 4 + 1) * 4
-            s = "0" * (next_multiple - len(s)) + s
-        limit = len(s) - (len(s) % 4)
-        for i in range(0, limit, 4):
-            ss = s[i : i + 4]
-            si = 0
-            for j in range(4):
-                si += int(ss[j]) * (2 ** (3 - j))
-            hex_parts.append(ss)
-            sh = hex(si)
-            h += sh[2]
-        return h.upper(), hex_parts
+        exponent_bits, mantissa_bits = len(self.exponent), len(self.mantissa)
+        bits = (
+            int(self.sign) << (exponent_bits + mantissa_bits)
+            | int(self.exponent, 2) << mantissa_bits
+            | int(self.mantissa, 2)
+        )
+        nibbles = (exponent_bits + mantissa_bits + 4) // 4
+        s = f"{bits:0{4 * nibbles}b}"
+        hex_parts = [s[i : i + 4] for i in range(0, len(s), 4)]
+        return f"{bits:0{nibbles}X}", hex_parts
+
+    def __convert(self) -> (Decimal, Decimal):
+        if self.__edge_case is not None:
+            raise AttributeError("Edge cases do not have a converted number")
+        self.converted_number, self.error = self.back_to_decimal_from_bits()
+        return self.converted_number, self.error
+
+    @cached_property
+    def converted_number(self) -> Decimal:
+        return self.__convert()[0]
+
+    @cached_property
+    def error(self) -> Decimal:
+        return self.__convert()[1]
+
+    @classmethod
+    def convert_many(cls, numbers, precision: int = 2) -> list:
+        """
+        IEEE 754 Representations of Many Numbers
+
+        Half, single and double precision numbers are read from the hardware
+        encoding, the rest is converted one by one.
+
+        Parameters
+        ----------
+        numbers : iterable
+            Floating point numbers to be converted.
+        precision : int, optional
+            Precision of the numbers, by default 2
+
+        Returns
+        -------
+        list
+            IEEE 754 representations of the numbers
+
+        Examples
+        --------
+        >>> IEEE754.convert_many([13.375, -0.75], 0)
+        ['0 10010 1010110000', '1 01110 1000000000']
+        """
+        representations = []
+        for x in numbers:
+            bits = _packed_bits(x, precision)
+            if bits is None:
+                representations.append(str(cls(x, precision)))
+                continue
+            exponent_bits, mantissa_bits = _EXPONENT[precision], _MANTISSA[precision]
+            sign = bits >> (exponent_bits + mantissa_bits)
+            exponent = (bits >> mantissa_bits) & ((1 << exponent_bits) - 1)
+            mantissa = bits & ((1 << mantissa_bits) - 1)
+            representations.append(
+                f"{sign} {exponent:0{exponent_bits}b} {mantissa:0{mantissa_bits}b}"
+            )
+        return representations
 
     def json(self) -> dict:
         return self.produce_output()
@@ -238,10 +368,8 @@ class IEEE754:
             self.output["scale"] = self.__scale
             self.output["scaled_number"] = self.number
             self.output["scaled_number_in_binary"] = self.binary
-            (
-                self.output["converted_number"],
-                self.output["error"],
-            ) = self.back_to_decimal_from_bits()
+            self.output["converted_number"] = self.converted_number
+            self.output["error"] = self.error
         else:
             self.output["edge_case"] = True
         return self.output
@@ -253,16 +381,18 @@ class IEEE754:
         Decimal
             Decimal representation of the number
         """
-        sign, exponent, mantissa = self.__str__().split(" ")
-        mantissa_base_10 = Decimal(0)
-        for i in range(len(mantissa)):
-            mantissa_base_10 += Decimal(int(mantissa[i]) * Decimal(2) ** -(i + 1))
-        self.output["mantissa_base_10"] = mantissa_base_10
-        sign = (-1) ** int(sign)
-        exponent = int(exponent, 2) - self.__bias
-        mantissa = int(mantissa, 2)
-        number = Decimal(sign * (1 + mantissa * 2**-self.__mantissa) * 2**exponent)
-        error = Decimal(self.original_number - number).copy_abs()
+        exponent = int(self.exponent, 2) - self.__bias
+        mantissa = int(self.mantissa, 2)
+        self.output["mantissa_base_10"] = _exact_binary(mantissa, -self.__mantissa)
+        # float arithmetic would underflow beyond double precision, so the
+        # number is built exactly from the significand
+        number = _exact_binary(
+            (1 << self.__mantissa) | mantissa, exponent - self.__mantissa
+        )
+        if self.sign == "1":
+            number = number.copy_negate()
+        with localcontext(self.__context):
+            error = (self.original_number - number).copy_abs()
         return number, error
 
 
@@ -285,11 +415,14 @@ def half(x: str) -> IEEE754:
     >>> half(13.375)
     0 10010 1010110000
 
-    >>> half(13.375).hex()
-    4AB0
+    >>> half(13.375).hex()[0]
+    '4AB0'
 
-    >>> half(13.375).json()
-    {'exponent-bits': 5, 'mantissa-bits': 10, 'bias': 15, 'sign': '0', 'exponent': '10010', 'mantissa': '1010110000', 'binary': '1101011', 'binary_output': '1101.011', 'hex': '4AB0', 'up scaled number': 107, 'scale': 3, 'number': 13.375}
+    >>> half(8.7).hex()[0]
+    '485A'
+
+    >>> half(8.7).converted_number
+    Decimal('8.703125')
 
     Project
     -------
@@ -317,11 +450,14 @@ def single(x: str) -> IEEE754:
     >>> single(13.375)
     0 10000010 10101100000000000000000
 
-    >>> single(13.375).hex()
-    41560000
+    >>> single(13.375).hex()[0]
+    '41560000'
+
+    >>> single(8.7).hex()[0]
+    '410B3333'
 
-    >>> single(13.375).json()
-    {'exponent-bits': 8, 'mantissa-bits': 23, 'bias': 127, 'sign': '0', 'exponent': '10000010', 'mantissa': '10101100000000000000000', 'binary': '1101011', 'binary_output': '1101.011', 'hex': '41560000', 'up scaled number': 107, 'scale': 3, 'number': 13.375}
+    >>> single(8.7).converted_number
+    Decimal('8.69999980926513671875')
 
     Project
     -------
@@ -349,11 +485,14 @@ def double(x: str) -> IEEE754:
     >>> double(13.375)
     0 10000000010 1010110000000000000000000000000000000000000000000000
 
-    >>> double(13.375).hex()
-    402AC00000000000
+    >>> double(13.375).hex()[0]
+    '402AC00000000000'
 
-    >>> double(13.375).json()
-    {'exponent-bits': 11, 'mantissa-bits': 52, 'bias': 1023, 'sign': '0', 'exponent': '10000000010', 'mantissa': '1010110000000000000000000000000000000000000000000000', 'binary': '1101011', 'binary_output': '1101.011', 'hex': '402AC00000000000', 'up scaled number': 107, 'scale': 3, 'number': 13.375}
+    >>> double(8.7).hex()[0]
+    '4021666666666666'
+
+    >>> double(8.7).converted_number
+    Decimal('8.699999999999999289457264239899814128875732421875')
 
     Project
     -------
@@ -381,11 +520,11 @@ def quadruple(x: str) -> IEEE754:
     >>> quadruple(13.375)
     0 100000000000010 1010110000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
 
-    >>> quadruple(13.375).hex()
-    4002AC00000000000000000000000000
+    >>> quadruple(13.375).hex()[0]
+    '4002AC00000000000000000000000000'
 
-    >>> quadruple(13.375).json()
-    {'exponent-bits': 15, 'mantissa-bits': 112, 'bias': 16383, 'sign': '0', 'exponent': '100000000000010', 'mantissa': '1010110000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000', 'binary': '1101011', 'binary_output': '1101.011', 'hex': '4002AC00000000000000000000000000', 'up scaled number': 107, 'scale': 3, 'number': 13.375}
+    >>> quadruple(8.7).hex()[0]
+    '40021666666666666666666666666666'
 
     Project
     -------
@@ -413,11 +552,11 @@ def octuple(x: str) -> IEEE754:
     >>> octuple(13.375)
     0 1000000000000000010 10101100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
 
-    >>> octuple(13.375).hex()
-    40002AC000000000000000000000000000000000000000000000000000000000
+    >>> octuple(13.375).hex()[0]
+    '40002AC000000000000000000000000000000000000000000000000000000000'
 
-    >>> octuple(13.375).json()
-    {'exponent-bits': 19, 'mantissa-bits': 236, 'bias': 262143, 'sign': '0', 'exponent': '1000000000000000010', 'mantissa': '10101100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000', 'binary': '1101011', 'binary_output': '1101.011', 'hex': '40002AC000000000000000000000000000000000000000000000000000000000', 'up scaled number': 107, 'scale': 3, 'number': 13.375}
+    >>> octuple(8.7).hex()[0]
+    '4000216666666666666666666666666666666666666666666666666666666666'
 
     Project
     -------
@@ -426,6 +565,69 @@ def octuple(x: str) -> IEEE754:
     return IEEE754(x, 4)
 
 
+def _packed_bits(x, precision: int) -> Optional[int]:
+    """
+    Bit pattern of x as encoded by the hardware, or None when the number
+    must go through IEEE754 instead: wide precisions, edge cases, numbers
+    out of the normalized range, and numbers whose rounding to double
+    lands exactly halfway between two numbers of the target precision.
+    """
+    try:
+        value = float(x)
+        packed = struct.pack(_STRUCT_FORMAT[precision], value)
+    except (KeyError, OverflowError, TypeError, ValueError):
+        return None
+    bits = int.from_bytes(packed, "big")
+    all_ones = (1 << _EXPONENT[precision]) - 1
+    if (bits >> _MANTISSA[precision]) & all_ones in (0, all_ones):
+        return None
+    dropped = _MANTISSA[2] - _MANTISSA[precision]
+    if dropped:
+        double_bits = int.from_bytes(struct.pack(">d", value), "big")
+        if double_bits & ((1 << dropped) - 1) == 1 << (dropped - 1):
+            return None
+    return bits
+
+
+def batch_hex(values, precision: int = 2) -> list:
+    """
+    IEEE 754 Hexadecimal Representation of Many Numbers
+
+    Half, single and double precision numbers are read from the hardware
+    encoding, the rest is converted one by one with IEEE754.
+
+    Parameters
+    ----------
+    values : iterable
+        Floating point numbers to be converted.
+    precision : int, optional
+        Precision of the numbers, by default 2
+
+    Returns
+    -------
+    list
+        Hexadecimal representations of the numbers
+
+    Examples
+    --------
+    >>> batch_hex([13.375, -0.75], 1)
+    ['41560000', 'BF400000']
+
+    Project
+    -------
+    https://github.com/canbula/ieee754
+    """
+    hexadecimals = []
+    for x in values:
+        bits = _packed_bits(x, precision)
+        if bits is None:
+            hexadecimals.append(IEEE754(x, precision).hex()[0])
+        else:
+            width = (1 + _EXPONENT[precision] + _MANTISSA[precision]) // 4
+            hexadecimals.append(f"{bits:0{width}X}")
+    return hexadecimals
+
+
 if __name__ == "__main__":
     # you can call the precision functions by using their names
     x = 13.375
@@ -468,3 +670,6 @@ if __name__ == "__main__":
     print(IEEE754("NaN"))
     print(IEEE754("-NaN"))
     print(half(-0.17))
+    # convert many numbers at once
+    print(batch_hex([13.375, 8.7, -0.75], 1))
+    print(IEEE754.convert_many([13.375, 8.7, -0.75], 1))
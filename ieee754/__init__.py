@@ -4,3 +4,4 @@ from ieee754.IEEE754 import single
 from ieee754.IEEE754 import double
 from ieee754.IEEE754 import quadruple
 from ieee754.IEEE754 import octuple
+from ieee754.IEEE754 import batch_hex
@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
@@ -23,6 +23,7 @@ setup(
         "floating-points",
         "binary-representation",
     ],
+    python_requires=">=3.8",
     install_requires=[],
     classifiers=[
         "Development Status :: 4 - Beta",  # "3 - Alpha", "4 - Beta" or "5 - Production/Stable"